@@ -4,12 +4,27 @@ This module provides generic utilities for validating and parsing HOCR XML outpu
 Engine-specific HOCR conversion logic belongs in the respective engine packages.
 """
 
+import functools
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from typing import NamedTuple
+from xml.sax.saxutils import escape
 
 from ocrbridge.core.exceptions import OCRBridgeError
 
+# hOCR bbox property, e.g. "bbox 10 20 50 40"; re.ASCII limits \d to 0-9
+_BBOX_RE = re.compile(r"bbox (\d+) (\d+) (\d+) (\d+)", re.ASCII)
+
+# Number of characters fed to the XML parser at a time
+_PARSE_CHUNK_SIZE = 64 * 1024
+
+# Only documents up to this many characters have their parse results cached
+_PARSE_CACHE_MAX_CHARS = 256 * 1024
+
+# Extra entities for escaping attribute values (escape() handles &, < and >)
+_XML_ATTR_ENTITIES = {'"': "&quot;", "'": "&apos;"}
+
 
 class HOCRParseError(OCRBridgeError):
     """Raised when HOCR parsing fails."""
@@ -35,6 +50,10 @@ def parse_hocr(hocr_content: str) -> HOCRInfo:
     """
     Parse HOCR content and extract information.
 
+    Results for the 64 most recently parsed documents of up to 256K characters are
+    cached, so repeated validation of the same content is cheap. Larger documents
+    are always parsed directly and never retained.
+
     Args:
         hocr_content: HOCR XML string
 
@@ -44,29 +63,43 @@ def parse_hocr(hocr_content: str) -> HOCRInfo:
     Raises:
         HOCRParseError: If parsing fails
     """
+    if len(hocr_content) <= _PARSE_CACHE_MAX_CHARS:
+        return _parse_hocr_cached(hocr_content)
+    return _parse_hocr(hocr_content)
+
+
+def _parse_hocr(hocr_content: str) -> HOCRInfo:
+    """Parse HOCR content by streaming its elements."""
+    page_count = 0
+    word_count = 0
+    has_bounding_boxes = False
+
+    # Stream the document instead of building a tree: only the class and title
+    # attributes of each element are needed. Closed elements are detached from their
+    # parent, so memory is bounded by nesting depth rather than document size.
+    # Matching on attributes also makes the XHTML namespace irrelevant.
+    open_elements: list[ET.Element] = []
     try:
-        root = ET.fromstring(hocr_content)
+        for event, elem in _iter_hocr_events(hocr_content):
+            if event == "end":
+                open_elements.pop()
+                if open_elements:
+                    open_elements[-1].remove(elem)
+                elem.clear()
+                continue
+
+            open_elements.append(elem)
+            element_class = elem.get("class")
+            if element_class == "ocr_page":
+                page_count += 1
+            elif element_class == "ocrx_word":
+                word_count += 1
+
+            if not has_bounding_boxes and "bbox " in (elem.get("title") or ""):
+                has_bounding_boxes = True
     except ET.ParseError as e:
         raise HOCRParseError(f"Failed to parse HOCR XML: {e}")
 
-    # Define namespace for XML queries (used if elements not found without it)
-    namespace = {"html": "http://www.w3.org/1999/xhtml"}
-
-    # Count pages (elements with class="ocr_page")
-    page_count = len(root.findall(".//*[@class='ocr_page']"))
-    if page_count == 0:
-        # Try with namespace
-        page_count = len(root.findall(".//*[@class='ocr_page']", namespace))
-
-    # Count words (elements with class="ocrx_word")
-    word_count = len(root.findall(".//*[@class='ocrx_word']"))
-    if word_count == 0:
-        # Try with namespace
-        word_count = len(root.findall(".//*[@class='ocrx_word']", namespace))
-
-    # Check for bounding boxes
-    has_bounding_boxes = "bbox" in hocr_content
-
     return HOCRInfo(
         page_count=page_count,
         word_count=word_count,
@@ -74,6 +107,24 @@ def parse_hocr(hocr_content: str) -> HOCRInfo:
     )
 
 
+# Memoized variant of _parse_hocr for small documents, see parse_hocr
+_parse_hocr_cached = functools.lru_cache(maxsize=64)(_parse_hocr)
+
+
+def _iter_hocr_events(hocr_content: str) -> Iterator[tuple[str, ET.Element]]:
+    """Yield start/end events for HOCR content, feeding the parser in slices.
+
+    Slicing the str directly avoids the full-document copy that encoding to bytes
+    or wrapping in io.StringIO would make.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    for offset in range(0, len(hocr_content), _PARSE_CHUNK_SIZE):
+        parser.feed(hocr_content[offset : offset + _PARSE_CHUNK_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
 def validate_hocr(hocr_content: str) -> None:
     """
     Validate HOCR content meets requirements.
@@ -105,10 +156,9 @@ def extract_bbox(element_title: str) -> tuple[int, int, int, int] | None:
     Returns:
         Tuple of (x0, y0, x1, y1) or None if no bbox found
     """
-    match = re.search(r"bbox (\d+) (\d+) (\d+) (\d+)", element_title)
+    match = _BBOX_RE.search(element_title)
     if match:
-        x0, y0, x1, y1 = match.groups()
-        return (int(x0), int(y0), int(x1), int(y1))
+        return (int(match[1]), int(match[2]), int(match[3]), int(match[4]))
     return None
 
 
@@ -122,7 +172,7 @@ def merge_hocr_pages(page_hocr_list: list[str], system_name: str = "unknown") ->
     Returns:
         Combined HOCR XML string.
     """
-    combined_body = ""
+    body_parts: list[str] = []
     body_open_tag = "<body>"
     body_close_tag = "</body>"
     for page_hocr in page_hocr_list:
@@ -130,14 +180,15 @@ def merge_hocr_pages(page_hocr_list: list[str], system_name: str = "unknown") ->
         start = page_hocr.find(body_open_tag)
         end = page_hocr.find(body_close_tag)
         if start != -1 and end != -1:
-            combined_body += page_hocr[start + len(body_open_tag) : end]
+            body_parts.append(page_hocr[start + len(body_open_tag) : end])
+    combined_body = "".join(body_parts)
 
     return f"""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
 <html xmlns="http://www.w3.org/1999/xhtml">
 <head>
 <meta http-equiv="content-type" content="text/html; charset=utf-8" />
-<meta name="ocr-system" content="{system_name}" />
+<meta name="ocr-system" content="{escape(system_name, _XML_ATTR_ENTITIES)}" />
 </head>
 <body>{combined_body}</body>
 </html>"""
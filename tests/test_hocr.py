@@ -2,11 +2,13 @@
 
 import pytest
 
+from ocrbridge.core.utils import hocr
 from ocrbridge.core.utils.hocr import (
     HOCRInfo,
     HOCRParseError,
     HOCRValidationError,
     extract_bbox,
+    merge_hocr_pages,
     parse_hocr,
     validate_hocr,
 )
@@ -27,6 +29,12 @@ VALID_HOCR = """<?xml version="1.0" encoding="UTF-8"?>
 </html>"""
 
 
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """Clear memoized parse results so each test exercises the parser."""
+    hocr._parse_hocr_cached.cache_clear()  # pyright: ignore[reportPrivateUsage]
+
+
 def test_parse_hocr_valid():
     """Test parsing valid HOCR."""
     info = parse_hocr(VALID_HOCR)
@@ -36,6 +44,48 @@ def test_parse_hocr_valid():
     assert info.has_bounding_boxes is True
 
 
+def test_parse_hocr_repeated():
+    """Test parsing the same document repeatedly returns the same result."""
+    assert parse_hocr(VALID_HOCR) is parse_hocr(VALID_HOCR)
+
+
+def test_parse_hocr_large_document_not_cached():
+    """Test that documents above the cache size limit bypass the cache."""
+    large = VALID_HOCR.replace("Hello", "Hello" * 60_000)
+    assert parse_hocr(large).word_count == 2
+    cache_info = hocr._parse_hocr_cached.cache_info()  # pyright: ignore[reportPrivateUsage]
+    assert cache_info.currsize == 0
+
+
+def test_parse_hocr_without_namespace():
+    """Test parsing HOCR that omits the XHTML namespace."""
+    info = parse_hocr(VALID_HOCR.replace(' xmlns="http://www.w3.org/1999/xhtml"', ""))
+    assert info == HOCRInfo(page_count=1, word_count=2, has_bounding_boxes=True)
+
+
+def test_parse_hocr_multiple_pages():
+    """Test counting pages and words across a multi-page document."""
+    page = VALID_HOCR[VALID_HOCR.index("<div") : VALID_HOCR.index("</div>") + len("</div>")]
+    multi_page = VALID_HOCR.replace(page, page * 3)
+    info = parse_hocr(multi_page)
+    assert info.page_count == 3
+    assert info.word_count == 6
+
+
+def test_parse_hocr_large_document():
+    """Test counting words in a document spanning many parser feeds."""
+    start = VALID_HOCR.index('<span class="ocrx_word"')
+    word = VALID_HOCR[start : VALID_HOCR.index("</span>", start) + len("</span>")]
+    large = VALID_HOCR.replace(word, word * 5000)
+    assert parse_hocr(large).word_count == 5001
+
+
+def test_parse_hocr_non_utf8_declaration():
+    """Test parsing a str whose XML declaration names a non-UTF-8 encoding."""
+    info = parse_hocr(VALID_HOCR.replace('encoding="UTF-8"', 'encoding="UTF-16"'))
+    assert info == HOCRInfo(page_count=1, word_count=2, has_bounding_boxes=True)
+
+
 def test_parse_hocr_invalid():
     """Test parsing invalid HOCR."""
     with pytest.raises(HOCRParseError):
@@ -74,6 +124,20 @@ def test_validate_hocr_no_bbox():
         validate_hocr(hocr_no_bbox)
 
 
+def test_parse_hocr_bbox_only_in_text():
+    """Test that 'bbox' appearing in text content is not a bounding box."""
+    hocr_bbox_text = """<?xml version="1.0" encoding="UTF-8"?>
+    <html xmlns="http://www.w3.org/1999/xhtml">
+    <body>
+      <div class="ocr_page" id="page_1">
+        <span class="ocrx_word" id="word_1">bbox 1 2 3 4</span>
+      </div>
+    </body>
+    </html>"""
+
+    assert parse_hocr(hocr_bbox_text).has_bounding_boxes is False
+
+
 def test_extract_bbox_valid():
     """Test extracting bounding box from title."""
     bbox = extract_bbox("bbox 10 20 50 60; x_wconf 95")
@@ -90,3 +154,51 @@ def test_extract_bbox_empty():
     """Test extracting bbox from empty string."""
     bbox = extract_bbox("")
     assert bbox is None
+
+
+def test_extract_bbox_not_leading():
+    """Test extracting bbox when it is not the first title property."""
+    bbox = extract_bbox("image 'page.png'; bbox 0 0 640 480; ppageno 0")
+    assert bbox == (0, 0, 640, 480)
+
+
+@pytest.mark.parametrize("title", ["bbox ١٠ 20 50 60", "ppageno 0; bbox ١٠ 20 50 60"])
+def test_extract_bbox_non_ascii_digits(title: str):
+    """Test that non-ASCII digits are not treated as coordinates."""
+    bbox = extract_bbox(title)
+    assert bbox is None
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("bbox 10 20 50 60", (10, 20, 50, 60)),
+        ("bbox 10 20 50 60;x_wconf 95", (10, 20, 50, 60)),
+        ("bbox 10 20 50 60 70", (10, 20, 50, 60)),
+        ("bbox 10 20 50 60abc", (10, 20, 50, 60)),
+        ("bbox 10 20 50 60; bbox 1 2 3 4", (10, 20, 50, 60)),
+        ("bbox 10 20 50", None),
+        ("bbox 10  20 50 60", None),
+        ("bbox +10 20 50 60", None),
+        ("bbox -10 20 50 60", None),
+        ("bbox 1_0 20 50 60", None),
+        ("bbox 10 20 50 1_000;x", (10, 20, 50, 1)),
+    ],
+)
+def test_extract_bbox_edge_cases(title: str, expected: tuple[int, int, int, int] | None):
+    """Test extracting bbox from irregular title layouts."""
+    assert extract_bbox(title) == expected
+
+
+def test_merge_hocr_pages():
+    """Test merging multiple HOCR pages into one document."""
+    merged = merge_hocr_pages([VALID_HOCR, VALID_HOCR], system_name="tesseract")
+    assert '<meta name="ocr-system" content="tesseract" />' in merged
+    assert parse_hocr(merged) == HOCRInfo(page_count=2, word_count=4, has_bounding_boxes=True)
+
+
+def test_merge_hocr_pages_escapes_system_name():
+    """Test that the system name is escaped in the metadata attribute."""
+    merged = merge_hocr_pages([VALID_HOCR], system_name='a "b" & <c>')
+    assert 'content="a &quot;b&quot; &amp; &lt;c&gt;"' in merged
+    validate_hocr(merged)